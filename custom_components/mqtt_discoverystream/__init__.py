@@ -1,24 +1,40 @@
 """Publish simple item state changes via MQTT."""
-import json
+import asyncio
 import logging
+from functools import lru_cache
 
 from homeassistant.components import mqtt
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
-from homeassistant.core import Event, HomeAssistant, State, callback
-from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.const import (
+    CONF_DOMAINS,
+    CONF_ENTITIES,
+    CONF_INCLUDE,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+    Platform,
+)
+from homeassistant.core import Event, HassJob, HomeAssistant, State, callback
+from homeassistant.helpers.entityfilter import (
+    CONF_ENTITY_GLOBS,
+    convert_include_exclude_filter,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.start import async_at_start
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     CONF_BASE_TOPIC,
+    CONF_COALESCE_MS,
     CONF_PUBLISH_ATTRIBUTES,
+    CONF_PUBLISH_ATTRIBUTES_INDIVIDUALLY,
     CONF_PUBLISH_DISCOVERY,
     CONF_PUBLISH_TIMESTAMPS,
+    CONF_PUBLISH_UNCHANGED,
     DOMAIN,
 )
 from .publisher import Publisher
 from .schema import CONFIG_SCHEMA  # noqa: F401
+from .utils import async_publish_attributes
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,10 +48,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         return False
 
     conf: ConfigType = config[DOMAIN]
-    publish_filter = convert_include_exclude_filter(conf)
+    publish_filter = lru_cache(maxsize=4096)(convert_include_exclude_filter(conf))
     base_topic: str = conf.get(CONF_BASE_TOPIC)
     publish_attributes: bool = conf.get(CONF_PUBLISH_ATTRIBUTES)
+    publish_attributes_individually: bool = conf.get(
+        CONF_PUBLISH_ATTRIBUTES_INDIVIDUALLY
+    )
     publish_timestamps: bool = conf.get(CONF_PUBLISH_TIMESTAMPS)
+    # Timestamp-only changes are what publish_timestamps exists to publish
+    publish_unchanged: bool = conf.get(CONF_PUBLISH_UNCHANGED) or publish_timestamps
+    include: ConfigType = conf.get(CONF_INCLUDE) or {}
+    coalesce_delay: float = conf.get(CONF_COALESCE_MS) / 1000
     if not base_topic.endswith("/"):
         base_topic = f"{base_topic}/"
 
@@ -43,39 +66,75 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     if publish_discovery:
         publisher = Publisher(hass, conf)
 
+    topic_cache: dict[str, str] = {}
+    pending: dict[str, Event] = {}
+
     async def _state_publisher(evt: Event) -> None:
         entity_id: str = evt.data["entity_id"]
         new_state: State = evt.data["new_state"]
 
-        mybase = f"{base_topic}{entity_id.replace('.', '/')}/"
+        if (mybase := topic_cache.get(entity_id)) is None:
+            mybase = f"{base_topic}{entity_id.replace('.', '/')}/"
+            topic_cache[entity_id] = mybase
+        pubs = []
         if publish_discovery:
-            await publisher.async_state_publish(entity_id, new_state, mybase)
+            pubs.append(publisher.async_state_publish(entity_id, new_state, mybase))
         else:
             payload = new_state.state
-            await mqtt.async_publish(hass, f"{mybase}state", payload, 1, True)
+            pubs.append(mqtt.async_publish(hass, f"{mybase}state", payload, 1, True))
 
         if publish_timestamps:
             if new_state.last_updated:
-                await mqtt.async_publish(
-                    hass,
-                    f"{mybase}last_updated",
-                    new_state.last_updated.isoformat(),
-                    1,
-                    True,
+                pubs.append(
+                    mqtt.async_publish(
+                        hass,
+                        f"{mybase}last_updated",
+                        new_state.last_updated.isoformat(),
+                        1,
+                        True,
+                    )
                 )
             if new_state.last_changed:
-                await mqtt.async_publish(
-                    hass,
-                    f"{mybase}last_changed",
-                    new_state.last_changed.isoformat(),
-                    1,
-                    True,
+                pubs.append(
+                    mqtt.async_publish(
+                        hass,
+                        f"{mybase}last_changed",
+                        new_state.last_changed.isoformat(),
+                        1,
+                        True,
+                    )
                 )
 
         if publish_attributes:
-            for key, val in new_state.attributes.items():
-                encoded_val = json.dumps(val, cls=JSONEncoder)
-                await mqtt.async_publish(hass, mybase + key, encoded_val, 1, True)
+            if publish_attributes_individually:
+                for key, val in new_state.attributes.items():
+                    encoded_val = json_bytes(val)
+                    pubs.append(
+                        mqtt.async_publish(hass, mybase + key, encoded_val, 1, True)
+                    )
+            elif not publish_discovery or new_state.domain == Platform.LIGHT:
+                # The discovery publisher already sends the attributes payload
+                # for every domain except light
+                pubs.append(async_publish_attributes(hass, new_state, mybase))
+
+        await asyncio.gather(*pubs)
+
+    @callback
+    def _flush_pending() -> None:
+        events = list(pending.values())
+        pending.clear()
+        for evt in events:
+            hass.async_create_task(_state_publisher(evt))
+
+    @callback
+    def _coalesce_state(evt: Event) -> None:
+        # Only the latest state per entity within the window gets published
+        if not pending:
+            hass.loop.call_later(coalesce_delay, _flush_pending)
+        pending[evt.data["entity_id"]] = evt
+
+    state_handler = _coalesce_state if coalesce_delay else _state_publisher
+    state_job = HassJob(state_handler)
 
     @callback
     def _ha_started(hass: HomeAssistant) -> None:
@@ -87,15 +146,42 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 return False
             if not publish_filter(entity_id):
                 return False
-            return True
+            if publish_unchanged:
+                return True
+            old_state: State | None = evt.data["old_state"]
+            return (
+                old_state is None
+                or old_state.state != new_state.state
+                or old_state.attributes != new_state.attributes
+            )
 
-        callback_handler = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, _state_publisher, _event_filter
-        )
+        @callback
+        def _tracked_state_publisher(evt: Event) -> None:
+            if _event_filter(evt):
+                hass.async_run_hass_job(state_job, evt)
+
+        if include.get(CONF_ENTITIES) and not (
+            include.get(CONF_DOMAINS) or include.get(CONF_ENTITY_GLOBS)
+        ):
+            # Only explicit entities are included, so let the event helper
+            # dispatch just those instead of filtering every state change
+            tracked_entities = [
+                entity_id
+                for entity_id in include[CONF_ENTITIES]
+                if publish_filter(entity_id)
+            ]
+            callback_handler = async_track_state_change_event(
+                hass, tracked_entities, _tracked_state_publisher
+            )
+        else:
+            callback_handler = hass.bus.async_listen(
+                EVENT_STATE_CHANGED, state_handler, _event_filter
+            )
 
         @callback
         def _ha_stopping(_: Event) -> None:
             callback_handler()
+            pending.clear()
 
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _ha_stopping)
 
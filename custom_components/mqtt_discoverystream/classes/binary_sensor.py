@@ -1,6 +1,6 @@
 """binary_sensor methods for MQTT Discovery Statestream."""
 
-from homeassistant.const import STATE_OFF, STATE_ON
+from ..const import PL_ON_OFF_CONFIG
 
 
 class BinarySensor:
@@ -8,5 +8,4 @@ class BinarySensor:
 
     def build_config(self, config):
         """Build the config for a binary_sensor."""
-        config["pl_off"] = STATE_OFF
-        config["pl_on"] = STATE_ON
+        config.update(PL_ON_OFF_CONFIG)
@@ -1,4 +1,5 @@
 """climate methods for MQTT Discovery Statestream."""
+import asyncio
 import logging
 
 from homeassistant.components import mqtt
@@ -41,10 +42,16 @@ from homeassistant.const import (
 )
 
 from ..const import ATTR_MODE_COMMAND, ATTR_PRESET_COMMAND, ATTR_TEMP_COMMAND
-from ..utils import async_publish_attribute, async_publish_base_attributes
+from ..utils import async_publish_attribute
 
 _LOGGER = logging.getLogger(__name__)
 
+_COMMAND_SERVICES = {
+    ATTR_MODE_COMMAND: (ATTR_HVAC_MODE, SERVICE_SET_HVAC_MODE),
+    ATTR_PRESET_COMMAND: (ATTR_PRESET_MODE, SERVICE_SET_PRESET_MODE),
+    ATTR_TEMP_COMMAND: (ATTR_TEMPERATURE, SERVICE_SET_TEMPERATURE),
+}
+
 
 class Climate:
     """Climate class."""
@@ -77,66 +84,47 @@ class Climate:
         config[CONF_TEMP_STEP] = step
 
     async def async_publish_state(self, new_state, mybase):
-        """Publish the state for a climate."""
+        """Publish the climate specific state topics."""
         _LOGGER.debug("New State %s;", new_state)
-        await async_publish_attribute(
-            self._hass, new_state, mybase, ATTR_HVAC_ACTION, True
-        )
-        await async_publish_attribute(
-            self._hass, new_state, mybase, ATTR_CURRENT_TEMPERATURE
-        )
-        await async_publish_attribute(
-            self._hass, new_state, mybase, ATTR_PRESET_MODE, True
-        )
-        await async_publish_attribute(self._hass, new_state, mybase, ATTR_TEMPERATURE)
-
-        await async_publish_base_attributes(self._hass, new_state, mybase)
-
         payload = new_state.state
         if payload == STATE_UNAVAILABLE:
             payload = STATE_OFF
-        await mqtt.async_publish(
-            self._hass, f"{mybase}{ATTR_HVAC_MODE}", payload, 1, True
+        await asyncio.gather(
+            async_publish_attribute(
+                self._hass, new_state, mybase, ATTR_HVAC_ACTION, True
+            ),
+            async_publish_attribute(
+                self._hass, new_state, mybase, ATTR_CURRENT_TEMPERATURE
+            ),
+            async_publish_attribute(
+                self._hass, new_state, mybase, ATTR_PRESET_MODE, True
+            ),
+            async_publish_attribute(self._hass, new_state, mybase, ATTR_TEMPERATURE),
+            mqtt.async_publish(
+                self._hass, f"{mybase}{ATTR_HVAC_MODE}", payload, 1, True
+            ),
         )
 
     async def async_subscribe(self, command_topic):
         """Subscribe to messages for climate."""
-        await self._hass.components.mqtt.async_subscribe(
-            f"{command_topic}{Platform.CLIMATE}/+/{ATTR_MODE_COMMAND}",
-            self._async_handle_message,
-        )
-        await self._hass.components.mqtt.async_subscribe(
-            f"{command_topic}{Platform.CLIMATE}/+/{ATTR_PRESET_COMMAND}",
-            self._async_handle_message,
-        )
-        await self._hass.components.mqtt.async_subscribe(
-            f"{command_topic}{Platform.CLIMATE}/+/{ATTR_TEMP_COMMAND}",
-            self._async_handle_message,
-        )
+        for element in _COMMAND_SERVICES:
+            await self._hass.components.mqtt.async_subscribe(
+                f"{command_topic}{Platform.CLIMATE}/+/{element}",
+                self._async_handle_message,
+            )
 
     async def _async_handle_message(self, msg):
         """Handle a message for a switch."""
-        explode_topic = msg.topic.split("/")
-        domain = explode_topic[1]
-        entity = explode_topic[2]
-        element = explode_topic[3]
+        _, domain, entity, element = msg.topic.rsplit("/", 3)
 
         _LOGGER.debug(
-            "Message received: topic %s; payload: %s", {msg.topic}, {msg.payload}
+            "Message received: topic %s; payload: %s", msg.topic, msg.payload
         )
 
+        attribute, service_name = _COMMAND_SERVICES[element]
         service_payload = {
             ATTR_ENTITY_ID: f"{domain}.{entity}",
+            attribute: msg.payload,
         }
 
-        if element == ATTR_MODE_COMMAND:
-            service_payload[ATTR_HVAC_MODE] = msg.payload
-            service_name = SERVICE_SET_HVAC_MODE
-        elif element == ATTR_PRESET_COMMAND:
-            service_payload[ATTR_PRESET_MODE] = msg.payload
-            service_name = SERVICE_SET_PRESET_MODE
-        elif element == ATTR_TEMP_COMMAND:
-            service_payload[ATTR_TEMPERATURE] = msg.payload
-            service_name = SERVICE_SET_TEMPERATURE
-
         await self._hass.services.async_call(domain, service_name, service_payload)
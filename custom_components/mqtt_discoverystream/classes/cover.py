@@ -1,7 +1,6 @@
 """cover methods for MQTT Discovery Statestream."""
 import logging
 
-from homeassistant.components import mqtt
 from homeassistant.components.cover import (
     ATTR_CURRENT_POSITION,
     ATTR_CURRENT_TILT_POSITION,
@@ -17,7 +16,6 @@ from homeassistant.components.mqtt.cover import (
 )
 from homeassistant.const import (
     ATTR_ENTITY_ID,
-    ATTR_STATE,
     SERVICE_CLOSE_COVER,
     SERVICE_OPEN_COVER,
     SERVICE_STOP_COVER,
@@ -25,10 +23,15 @@ from homeassistant.const import (
 )
 
 from ..const import ATTR_ATTRIBUTES, ATTR_SET, CONF_CMD_T
-from ..utils import async_publish_base_attributes
 
 _LOGGER = logging.getLogger(__name__)
 
+_PAYLOAD_SERVICES = {
+    DEFAULT_PAYLOAD_OPEN: SERVICE_OPEN_COVER,
+    DEFAULT_PAYLOAD_CLOSE: SERVICE_CLOSE_COVER,
+    DEFAULT_PAYLOAD_STOP: SERVICE_STOP_COVER,
+}
+
 
 class Cover:
     """Cover class."""
@@ -52,14 +55,6 @@ class Cover:
                 "{{ value_json['" + ATTR_CURRENT_TILT_POSITION + "'] }}"
             )
 
-    async def async_publish_state(self, new_state, mybase):
-        """Build the state for a light."""
-        await async_publish_base_attributes(self._hass, new_state, mybase)
-
-        await mqtt.async_publish(
-            self._hass, f"{mybase}{ATTR_STATE}", new_state.state, 1, True
-        )
-
     async def async_subscribe(self, command_topic):
         """Subscribe to messages for a cover."""
         await self._hass.components.mqtt.async_subscribe(
@@ -69,30 +64,20 @@ class Cover:
 
     async def _async_handle_message(self, msg):
         """Handle a message for a cover."""
-        explode_topic = msg.topic.split("/")
-        domain = explode_topic[1]
-        entity = explode_topic[2]
+        _, domain, entity, _ = msg.topic.rsplit("/", 3)
 
         _LOGGER.debug(
-            "Message received: topic %s; payload: %s", {msg.topic}, {msg.payload}
+            "Message received: topic %s; payload: %s", msg.topic, msg.payload
         )
 
-        if msg.payload == DEFAULT_PAYLOAD_OPEN:
-            await self._hass.services.async_call(
-                domain, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: f"{domain}.{entity}"}
-            )
-        elif msg.payload == DEFAULT_PAYLOAD_CLOSE:
-            await self._hass.services.async_call(
-                domain, SERVICE_CLOSE_COVER, {ATTR_ENTITY_ID: f"{domain}.{entity}"}
-            )
-        elif msg.payload == DEFAULT_PAYLOAD_STOP:
+        if service_name := _PAYLOAD_SERVICES.get(msg.payload):
             await self._hass.services.async_call(
-                domain, SERVICE_STOP_COVER, {ATTR_ENTITY_ID: f"{domain}.{entity}"}
+                domain, service_name, {ATTR_ENTITY_ID: f"{domain}.{entity}"}
             )
         else:
             _LOGGER.error(
                 'Invalid service for "%s" - payload: %s for %s',
                 ATTR_SET,
-                {msg.payload},
-                {entity},
+                msg.payload,
+                entity,
             )
@@ -1,8 +1,6 @@
 """light methods for MQTT Discovery Statestream."""
-import json
 import logging
 
-from homeassistant.components import mqtt
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_COLOR_MODE,
@@ -26,7 +24,8 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.helpers.entity import get_supported_features
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 
 from ..const import (
     ATTR_B,
@@ -47,6 +46,12 @@ from ..const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_COLOR_MAP = (
+    (ATTR_HS_COLOR, (ATTR_H, ATTR_S)),
+    (ATTR_XY_COLOR, (ATTR_X, ATTR_Y)),
+    (ATTR_RGB_COLOR, (ATTR_R, ATTR_G, ATTR_B)),
+)
+
 
 class Light:
     """Light class."""
@@ -58,7 +63,7 @@ class Light:
     def build_config(self, config, entity_id, attributes, mycommand):
         """Build the config for a light."""
         del config[CONF_JSON_ATTR_T]
-        config[CONF_CMD_T] = f"{ mycommand}{ATTR_SET_LIGHT}"
+        config[CONF_CMD_T] = f"{mycommand}{ATTR_SET_LIGHT}"
         config[CONF_SCHEMA] = ATTR_JSON
 
         supported_features = get_supported_features(self._hass, entity_id)
@@ -71,8 +76,8 @@ class Light:
             config[ATTR_SUPPORTED_COLOR_MODES] = attributes[ATTR_SUPPORTED_COLOR_MODES]
             config[ATTR_BRIGHTNESS] = True
 
-    async def async_publish_state(self, new_state, mybase):
-        """Build the state for a light."""
+    def build_state(self, new_state):
+        """Build the JSON state payload for a light."""
         payload = {
             ATTR_STATE: STATE_CAPITAL_ON
             if new_state.state == STATE_ON
@@ -88,21 +93,13 @@ class Light:
             payload[ATTR_EFFECT] = new_state.attributes[ATTR_EFFECT]
 
         color = {}
-        if ATTR_HS_COLOR in new_state.attributes:
-            color[ATTR_H] = new_state.attributes[ATTR_HS_COLOR][0]
-            color[ATTR_S] = new_state.attributes[ATTR_HS_COLOR][1]
-        if ATTR_XY_COLOR in new_state.attributes:
-            color[ATTR_X] = new_state.attributes[ATTR_XY_COLOR][0]
-            color[ATTR_Y] = new_state.attributes[ATTR_XY_COLOR][1]
-        if ATTR_RGB_COLOR in new_state.attributes:
-            color[ATTR_R] = new_state.attributes[ATTR_RGB_COLOR][0]
-            color[ATTR_G] = new_state.attributes[ATTR_RGB_COLOR][1]
-            color[ATTR_B] = new_state.attributes[ATTR_RGB_COLOR][2]
+        for attribute, keys in _COLOR_MAP:
+            if values := new_state.attributes.get(attribute):
+                color.update(zip(keys, values))
         if color:
             payload[ATTR_COLOR] = color
 
-        payload = json.dumps(payload, cls=JSONEncoder)
-        await mqtt.async_publish(self._hass, f"{mybase}{ATTR_STATE}", payload, 1, True)
+        return json_bytes(payload)
 
     async def async_subscribe(self, command_topic):
         """Subscribe to messages for a light."""
@@ -113,15 +110,13 @@ class Light:
 
     async def _async_handle_message(self, msg):
         """Handle a message for a light."""
-        explode_topic = msg.topic.split("/")
-        domain = explode_topic[1]
-        entity = explode_topic[2]
+        _, domain, entity, _ = msg.topic.rsplit("/", 3)
 
         _LOGGER.debug(
-            "Message received: topic %s; payload: %s", {msg.topic}, {msg.payload}
+            "Message received: topic %s; payload: %s", msg.topic, msg.payload
         )
 
-        payload_json = json.loads(msg.payload)
+        payload_json = json_loads(msg.payload)
         service_payload = {
             ATTR_ENTITY_ID: f"{domain}.{entity}",
         }
@@ -133,23 +128,10 @@ class Light:
                 service_payload[ATTR_BRIGHTNESS] = payload_json[ATTR_BRIGHTNESS]
             if ATTR_COLOR_TEMP in payload_json:
                 service_payload[ATTR_COLOR_TEMP] = payload_json[ATTR_COLOR_TEMP]
-            if ATTR_COLOR in payload_json:
-                if ATTR_H in payload_json[ATTR_COLOR]:
-                    service_payload[ATTR_HS_COLOR] = [
-                        payload_json[ATTR_COLOR][ATTR_H],
-                        payload_json[ATTR_COLOR][ATTR_S],
-                    ]
-                if ATTR_X in payload_json[ATTR_COLOR]:
-                    service_payload[ATTR_XY_COLOR] = [
-                        payload_json[ATTR_COLOR][ATTR_X],
-                        payload_json[ATTR_COLOR][ATTR_Y],
-                    ]
-                if ATTR_R in payload_json[ATTR_COLOR]:
-                    service_payload[ATTR_RGB_COLOR] = [
-                        payload_json[ATTR_COLOR][ATTR_R],
-                        payload_json[ATTR_COLOR][ATTR_G],
-                        payload_json[ATTR_COLOR][ATTR_B],
-                    ]
+            if color := payload_json.get(ATTR_COLOR):
+                for attribute, keys in _COLOR_MAP:
+                    if keys[0] in color:
+                        service_payload[attribute] = [color[key] for key in keys]
             await self._hass.services.async_call(
                 domain, SERVICE_TURN_ON, service_payload
             )
@@ -161,6 +143,6 @@ class Light:
             _LOGGER.error(
                 'Invalid state for "%s" - payload: %s for %s',
                 ATTR_SET_LIGHT,
-                {msg.payload},
-                {entity},
+                msg.payload,
+                entity,
             )
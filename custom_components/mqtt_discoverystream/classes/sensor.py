@@ -1,6 +1,5 @@
 """sensor methods for MQTT Discovery Statestream."""
 from homeassistant.components.sensor import DOMAIN as sensordomain
-from homeassistant.helpers import entity_registry
 
 from ..const import ATTR_SUGGESTED_DISPLAY_PRECISION, CONF_SUG_DSP_PRC
 
@@ -10,13 +9,12 @@ class Sensor:
 
     def __init__(self, hass):
         """Initialise the sensor class."""
-        self._ent_reg = entity_registry.async_get(hass)
         self._hass = hass
 
-    def build_config(self, config, entity_id):
+    def build_config(self, config, entry):
         """Build the config for a sensor."""
 
-        if entry := self._ent_reg.async_get(entity_id):
+        if entry:
             if options := entry.options:
                 if sensordomain in options:
                     sensor_options = options[sensordomain]
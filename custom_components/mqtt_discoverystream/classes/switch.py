@@ -10,10 +10,15 @@ from homeassistant.const import (
     Platform,
 )
 
-from ..const import ATTR_SET, CONF_CMD_T, CONF_PL_OFF, CONF_PL_ON
+from ..const import ATTR_SET, CONF_CMD_T, PL_ON_OFF_CONFIG
 
 _LOGGER = logging.getLogger(__name__)
 
+_PAYLOAD_SERVICES = {
+    STATE_ON: SERVICE_TURN_ON,
+    STATE_OFF: SERVICE_TURN_OFF,
+}
+
 
 class Switch:
     """Switch class."""
@@ -24,8 +29,7 @@ class Switch:
 
     def build_config(self, config, mycommand):
         """Build the config for a switch."""
-        config[CONF_PL_OFF] = STATE_OFF
-        config[CONF_PL_ON] = STATE_ON
+        config.update(PL_ON_OFF_CONFIG)
         config[CONF_CMD_T] = f"{mycommand}{ATTR_SET}"
 
     async def async_subscribe(self, command_topic):
@@ -37,26 +41,20 @@ class Switch:
 
     async def _async_handle_message(self, msg):
         """Handle a message for a switch."""
-        explode_topic = msg.topic.split("/")
-        domain = explode_topic[1]
-        entity = explode_topic[2]
+        _, domain, entity, _ = msg.topic.rsplit("/", 3)
 
         _LOGGER.debug(
-            "Message received: topic %s; payload: %s", {msg.topic}, {msg.payload}
+            "Message received: topic %s; payload: %s", msg.topic, msg.payload
         )
 
-        if msg.payload == STATE_ON:
-            await self._hass.services.async_call(
-                domain, SERVICE_TURN_ON, {ATTR_ENTITY_ID: f"{domain}.{entity}"}
-            )
-        elif msg.payload == STATE_OFF:
+        if service_name := _PAYLOAD_SERVICES.get(msg.payload):
             await self._hass.services.async_call(
-                domain, SERVICE_TURN_OFF, {ATTR_ENTITY_ID: f"{domain}.{entity}"}
+                domain, service_name, {ATTR_ENTITY_ID: f"{domain}.{entity}"}
             )
         else:
             _LOGGER.error(
                 'Invalid service for "%s" - payload: %s for %s',
                 ATTR_SET,
-                {msg.payload},
-                {entity},
+                msg.payload,
+                entity,
             )
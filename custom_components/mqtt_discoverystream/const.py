@@ -1,4 +1,5 @@
 """Constants for MQTT Discovery Stream."""
+from homeassistant.const import STATE_OFF, STATE_ON
 
 ATTR_COLOR = "color"
 ATTR_H = "h"
@@ -23,13 +24,18 @@ ATTR_SUGGESTED_DISPLAY_PRECISION = "suggested_display_precision"
 CONF_BASE_TOPIC = "base_topic"
 CONF_DISCOVERY_TOPIC = "discovery_topic"
 CONF_COMMAND_TOPIC = "command_topic"
+CONF_COALESCE_MS = "coalesce_ms"
 CONF_PUBLISH_ATTRIBUTES = "publish_attributes"
+CONF_PUBLISH_ATTRIBUTES_INDIVIDUALLY = "publish_attributes_individually"
 CONF_PUBLISH_TIMESTAMPS = "publish_timestamps"
 CONF_PUBLISH_DISCOVERY = "publish_discovery"
+CONF_PUBLISH_UNCHANGED = "publish_unchanged"
 CONF_PUBLISHED = "conf_published"
 
 DOMAIN = "mqtt_discoverystream"
 
+ACTION_REMOVE = "remove"
+
 STATE_CAPITAL_ON = "ON"
 STATE_CAPITAL_OFF = "OFF"
 
@@ -54,3 +60,8 @@ CONF_IDS = "ids"
 CONF_CNS = "cns"
 CONF_PL_ON = "pl_on"
 CONF_PL_OFF = "pl_off"
+
+PL_ON_OFF_CONFIG = {
+    CONF_PL_OFF: STATE_OFF,
+    CONF_PL_ON: STATE_ON,
+}
@@ -1,11 +1,12 @@
 """Publishing for MQTT Discovery Stream."""
-import json
+from operator import itemgetter
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.const import CONF_AVAILABILITY, DATA_MQTT
 from homeassistant.components.sensor import ATTR_STATE_CLASS
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_ICON,
     ATTR_STATE,
@@ -14,8 +15,9 @@ from homeassistant.const import (
     CONF_NAME,
     Platform,
 )
+from homeassistant.core import Event, callback
 from homeassistant.helpers import device_registry, entity_registry
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_bytes
 
 from .classes.binary_sensor import BinarySensor
 from .classes.climate import Climate
@@ -24,6 +26,7 @@ from .classes.light import Light
 from .classes.sensor import Sensor
 from .classes.switch import Switch
 from .const import (
+    ACTION_REMOVE,
     ATTR_ATTRIBUTES,
     ATTR_CONFIG,
     CONF_AVTY_T,
@@ -70,6 +73,11 @@ class Discovery:
         self._sensor = Sensor(hass)
         self._switch = Switch(hass)
         self._cover = Cover(hass)
+        self._published = hass.data[DOMAIN][CONF_PUBLISHED]
+        self._published_configs: dict[str, bytes] = {}
+        hass.bus.async_listen(
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated
+        )
 
     async def async_discovery_publish(self, entity_id, attributes, mybase):
         """Publish Discovery information for entitiy."""
@@ -77,13 +85,17 @@ class Discovery:
         ent_parts = entity_id.split(".")
         ent_domain = ent_parts[0]
 
-        config = self._build_base(entity_id, attributes, mybase)
+        device = None
+        if (entry := self._ent_reg.async_get(entity_id)) and entry.device_id:
+            device = self._dev_reg.async_get(entry.device_id)
+
+        config = self._build_base(entity_id, attributes, mybase, entry, device)
 
         publish_config = False
         if ent_domain == Platform.SENSOR and (
             self._has_includes or ATTR_DEVICE_CLASS in attributes
         ):
-            self._sensor.build_config(config, entity_id)
+            self._sensor.build_config(config, entry)
             publish_config = True
 
         elif ent_domain == Platform.BINARY_SENSOR and (
@@ -112,17 +124,33 @@ class Discovery:
             publish_config = True
 
         if publish_config:
-            if device := self._build_device(entity_id):
-                config[CONF_DEV] = device
-
-            encoded = json.dumps(config, cls=JSONEncoder)
-            entity_disc_topic = (
-                f"{self._discovery_topic}{entity_id.replace('.', '/')}/{ATTR_CONFIG}"
-            )
-            await mqtt.async_publish(self._hass, entity_disc_topic, encoded, 1, True)
-            self._hass.data[DOMAIN][CONF_PUBLISHED].append(entity_id)
-
-    def _build_base(self, entity_id, attributes, mybase):
+            if config_device := self._build_device(device):
+                config[CONF_DEV] = config_device
+
+            encoded = json_bytes(config)
+            if self._published_configs.get(entity_id) != encoded:
+                entity_disc_topic = (
+                    f"{self._discovery_topic}{entity_id.replace('.', '/')}/{ATTR_CONFIG}"
+                )
+                await mqtt.async_publish(
+                    self._hass, entity_disc_topic, encoded, 1, True
+                )
+                self._published_configs[entity_id] = encoded
+            self._published.add(entity_id)
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Force a rebuild of discovery config when a registry entry changes."""
+        entity_id = event.data[ATTR_ENTITY_ID]
+        if event.data["action"] == ACTION_REMOVE:
+            self._published_configs.pop(entity_id, None)
+        self._published.discard(entity_id)
+        if old_entity_id := event.data.get("old_entity_id"):
+            # A rename leaves the old entity_id behind like a removal
+            self._published_configs.pop(old_entity_id, None)
+            self._published.discard(old_entity_id)
+
+    def _build_base(self, entity_id, attributes, mybase, entry, device):
         # sourcery skip: assign-if-exp, merge-dict-assign
         ent_parts = entity_id.split(".")
         ent_id = ent_parts[1]
@@ -139,13 +167,11 @@ class Discovery:
             name = attributes[ATTR_FRIENDLY_NAME]
         else:
             name = ent_id.replace("_", " ").title()
-        if entry := self._ent_reg.async_get(entity_id):
-            if entry.device_id and name:
-                device = self._dev_reg.async_get(entry.device_id)
-                if device and name.startswith(device.name):
-                    name = name[len(device.name) + 1 :].strip()
-                    if name == "":
-                        name = None
+        if entry:
+            if device and name and name.startswith(device.name):
+                name = name[len(device.name) + 1 :].strip()
+                if name == "":
+                    name = None
             if entry.entity_category:
                 config[CONF_ENT_CAT] = entry.entity_category
             if entry.original_device_class:
@@ -163,22 +189,20 @@ class Discovery:
 
         return config
 
-    def _build_device(self, entity_id):  # sourcery skip: extract-method
+    def _build_device(self, device):  # sourcery skip: extract-method
         config_device = {}
-        entry = self._ent_reg.async_get(entity_id)
-        if entry and entry.device_id:
-            if device := self._dev_reg.async_get(entry.device_id):
-                if device.manufacturer:
-                    config_device[CONF_MF] = device.manufacturer
-                if device.model:
-                    config_device[CONF_MDL] = device.model
-                if device.name:
-                    config_device[CONF_NAME] = device.name
-                if device.sw_version:
-                    config_device[CONF_SW] = device.sw_version
-                if device.identifiers:
-                    config_device[CONF_IDS] = [id[1] for id in device.identifiers]
-                if device.connections:
-                    config_device[CONF_CNS] = device.connections
+        if device:
+            if device.manufacturer:
+                config_device[CONF_MF] = device.manufacturer
+            if device.model:
+                config_device[CONF_MDL] = device.model
+            if device.name:
+                config_device[CONF_NAME] = device.name
+            if device.sw_version:
+                config_device[CONF_SW] = device.sw_version
+            if device.identifiers:
+                config_device[CONF_IDS] = list(map(itemgetter(1), device.identifiers))
+            if device.connections:
+                config_device[CONF_CNS] = device.connections
 
         return config_device
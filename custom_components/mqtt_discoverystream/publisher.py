@@ -1,4 +1,5 @@
 """Discovery for MQTT Discovery Stream."""
+import asyncio
 import logging
 
 from homeassistant.components import mqtt
@@ -8,7 +9,13 @@ from homeassistant.components.mqtt.const import (
     DEFAULT_PAYLOAD_AVAILABLE,
     DEFAULT_PAYLOAD_NOT_AVAILABLE,
 )
-from homeassistant.const import CONF_INCLUDE, STATE_UNAVAILABLE, STATE_UNKNOWN, Platform
+from homeassistant.const import (
+    ATTR_STATE,
+    CONF_INCLUDE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    Platform,
+)
 from homeassistant.setup import async_when_setup
 
 from .classes.climate import Climate
@@ -23,10 +30,12 @@ from .const import (
     DOMAIN,
 )
 from .discovery import Discovery
-from .utils import async_publish_base_attributes
+from .utils import async_publish_attributes
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNAVAILABLE_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN, None})
+
 
 class Publisher:
     """Manage publication for MQTT Discovery Statestream."""
@@ -41,7 +50,8 @@ class Publisher:
         self._command_topic = conf.get(CONF_COMMAND_TOPIC) or conf.get(CONF_BASE_TOPIC)
         if not self._command_topic.endswith("/"):
             self._command_topic = f"{self._command_topic}/"
-        self._hass.data[DOMAIN] = {CONF_PUBLISHED: []}
+        self._published = set()
+        self._hass.data[DOMAIN] = {CONF_PUBLISHED: self._published}
         self._climate = Climate(hass)
         self._light = Light(hass)
         self._switch = Switch(hass)
@@ -51,30 +61,39 @@ class Publisher:
 
     async def async_state_publish(self, entity_id, new_state, mybase):
         """Publish state for MQTT Discovery Statestream."""
-        ent_parts = entity_id.split(".")
-        ent_domain = ent_parts[0]
+        ent_domain = new_state.domain
 
-        if entity_id not in self._hass.data[DOMAIN][CONF_PUBLISHED]:
+        if entity_id not in self._published:
             await self._discovery.async_discovery_publish(
                 entity_id, new_state.attributes, mybase
             )
 
+        pubs = []
         if ent_domain == Platform.LIGHT:
-            await self._light.async_publish_state(new_state, mybase)
-        elif ent_domain == Platform.CLIMATE:
-            await self._climate.async_publish_state(new_state, mybase)
-        elif ent_domain == Platform.COVER:
-            await self._cover.async_publish_state(new_state, mybase)
+            state_payload = self._light.build_state(new_state)
         else:
-            await async_publish_base_attributes(self._hass, new_state, mybase)
+            state_payload = new_state.state
+            pubs.append(async_publish_attributes(self._hass, new_state, mybase))
+            if ent_domain == Platform.CLIMATE:
+                pubs.append(self._climate.async_publish_state(new_state, mybase))
 
-        payload = (
+        availability_payload = (
             DEFAULT_PAYLOAD_NOT_AVAILABLE
-            if new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None)
+            if new_state.state in _UNAVAILABLE_STATES
             else DEFAULT_PAYLOAD_AVAILABLE
         )
-        await mqtt.async_publish(
-            self._hass, f"{mybase}{CONF_AVAILABILITY}", payload, 1, True
+        await asyncio.gather(
+            *pubs,
+            mqtt.async_publish(
+                self._hass, f"{mybase}{ATTR_STATE}", state_payload, 1, True
+            ),
+            mqtt.async_publish(
+                self._hass,
+                f"{mybase}{CONF_AVAILABILITY}",
+                availability_payload,
+                1,
+                True,
+            ),
         )
 
     async def _async_subscribe(
@@ -6,11 +6,14 @@ from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEM
 
 from .const import (
     CONF_BASE_TOPIC,
+    CONF_COALESCE_MS,
     CONF_COMMAND_TOPIC,
     CONF_DISCOVERY_TOPIC,
     CONF_PUBLISH_ATTRIBUTES,
+    CONF_PUBLISH_ATTRIBUTES_INDIVIDUALLY,
     CONF_PUBLISH_DISCOVERY,
     CONF_PUBLISH_TIMESTAMPS,
+    CONF_PUBLISH_UNCHANGED,
     DOMAIN,
 )
 
@@ -22,8 +25,13 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_DISCOVERY_TOPIC): vol.Any(valid_publish_topic, None),
                 vol.Optional(CONF_COMMAND_TOPIC): vol.Any(valid_publish_topic, None),
                 vol.Optional(CONF_PUBLISH_ATTRIBUTES, default=False): cv.boolean,
+                vol.Optional(
+                    CONF_PUBLISH_ATTRIBUTES_INDIVIDUALLY, default=False
+                ): cv.boolean,
                 vol.Optional(CONF_PUBLISH_TIMESTAMPS, default=False): cv.boolean,
                 vol.Optional(CONF_PUBLISH_DISCOVERY, default=False): cv.boolean,
+                vol.Optional(CONF_PUBLISH_UNCHANGED, default=False): cv.boolean,
+                vol.Optional(CONF_COALESCE_MS, default=0): cv.positive_int,
             }
         ),
     },